@@ -1,12 +1,22 @@
 # main.py (完整可覆蓋版本)
 import os
 import sys
+import glob
 import math
-from typing import Any, Dict, List, Optional, Tuple
+import pickle
+import hashlib
+import functools
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import pygame
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml（C 實作，較快）
+except ImportError:
+    from yaml import SafeLoader
+
 from minigames import MINIGAMES
 
 # -------------------------
@@ -33,6 +43,10 @@ DIALOGUE_H = int(SCREEN_H * 0.28)
 DIALOGUE_RECT = pygame.Rect(50, SCREEN_H - DIALOGUE_H - 35, SCREEN_W - 100, DIALOGUE_H)
 NAME_RECT = pygame.Rect(DIALOGUE_RECT.x, DIALOGUE_RECT.y - 45, 260, 40)
 CHOICE_ITEM_H = 54
+HINT_TEXT = "（左鍵 / Enter：若還在打字→直接顯示全文；否則→下一句｜ESC 離開）"
+
+# 字型
+FONT_NAME = "Microsoft JhengHei"
 
 # Colors
 WHITE = (255, 255, 255)
@@ -42,6 +56,8 @@ DIM = (0, 0, 0, 160)
 # 角色立繪顯示比例
 CHAR_HEIGHT_RATIO = 0.82
 CHAR_BOTTOM_PAD = 12
+# pos → 立繪中心點佔螢幕寬度比例（其他值一律置中）
+CHAR_POS_X_FRAC = {"left": 0.23, "center": 0.50, "right": 0.77}
 
 # 打字機效果
 TYPE_SPEED_CHARS_PER_SEC = 40
@@ -49,12 +65,112 @@ TYPE_SPEED_CHARS_PER_SEC = 40
 # 角色跳動效果
 BOUNCE_DURATION = 0.22
 BOUNCE_HEIGHT = 14
+BOUNCE_DURATION_MS = round(BOUNCE_DURATION * 1000)
 
 # -------------------------
 # 工具
 # -------------------------
 def clamp(v: float, a: float, b: float) -> float:
-    return max(a, min(b, v))
+    return a if v < a else (b if v > b else v)
+
+@functools.lru_cache(maxsize=32)
+def get_font(size: int, bold: bool = False) -> pygame.font.Font:
+    """同尺寸字型共用一個 Font（SysFont 每次都會重新找字型檔）"""
+    return pygame.font.SysFont(FONT_NAME, size, bold=bold)
+
+GlyphLayout = List[Tuple[pygame.Surface, Tuple[int, int]]]
+
+class GlyphCache:
+    """
+    單一 (字型, 顏色) 的字形快取：
+    - 每個字元只 render / 量寬一次
+    - 排版結果依 (text, rect, line_spacing) 快取，打完字後不再重算換行
+    """
+    MAX_LAYOUTS = 256
+
+    def __init__(self, font: pygame.font.Font, color: Tuple[int, int, int]):
+        self.font = font
+        self.color = color
+        self._glyphs: Dict[str, Tuple[pygame.Surface, int]] = {}
+        self._layouts: Dict[Tuple[str, Tuple[int, int, int, int], int], GlyphLayout] = {}
+
+    def glyph(self, ch: str) -> Tuple[pygame.Surface, int]:
+        g = self._glyphs.get(ch)
+        if g is None:
+            img = self.font.render(ch, True, self.color).convert_alpha()
+            g = (img, self.font.size(ch)[0])
+            self._glyphs[ch] = g
+        return g
+
+    def layout(self, text: str, rect: pygame.Rect, line_spacing: int = 4) -> GlyphLayout:
+        key = (text, (rect.x, rect.y, rect.w, rect.h), line_spacing)
+        out = self._layouts.get(key)
+        if out is None:
+            out = self._build_layout(text, rect, line_spacing)
+            if len(self._layouts) >= self.MAX_LAYOUTS:
+                self._layouts.clear()
+            self._layouts[key] = out
+        return out
+
+    def _build_layout(self, text: str, rect: pygame.Rect, line_spacing: int) -> GlyphLayout:
+        out: GlyphLayout = []
+        append = out.append
+        glyphs = self._glyphs
+        glyph = self.glyph
+        x, y = rect.x, rect.y
+        max_w = rect.w
+        font_h = self.font.get_height()
+        line_h = font_h + line_spacing
+        para_gap = int(line_spacing * 0.5)
+        bottom = rect.y + rect.h - font_h
+
+        paragraphs = text.split("\n")
+        last = len(paragraphs) - 1
+        for p_i, para in enumerate(paragraphs):
+            if y > bottom:
+                break
+
+            line_w = 0
+            for ch in para:
+                img, adv = glyphs.get(ch) or glyph(ch)
+                if line_w and line_w + adv > max_w:
+                    y += line_h
+                    if y > bottom:
+                        return out
+                    line_w = 0
+                append((img, (x + line_w, y)))
+                line_w += adv
+
+            if line_w:
+                y += line_h
+
+            if p_i != last:
+                y += para_gap
+        return out
+
+_glyph_caches: Dict[Tuple[pygame.font.Font, Tuple[int, int, int]], GlyphCache] = {}
+
+def glyph_cache(font: pygame.font.Font, color: Tuple[int, int, int]) -> GlyphCache:
+    key = (font, tuple(color))
+    gc = _glyph_caches.get(key)
+    if gc is None:
+        gc = GlyphCache(font, color)
+        _glyph_caches[key] = gc
+    return gc
+
+_line_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+LINE_CACHE_MAX = 2048
+
+def render_line(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """單行文字 render 結果快取（滿了就丟最舊的）"""
+    key = (font, text, tuple(color))
+    img = _line_cache.get(key)
+    if img is None:
+        img = font.render(text, True, color).convert_alpha()
+        if len(_line_cache) >= LINE_CACHE_MAX:
+            del _line_cache[next(iter(_line_cache))]
+        _line_cache[key] = img
+    return img
 
 def draw_text(
     surface: pygame.Surface,
@@ -67,50 +183,64 @@ def draw_text(
 ):
     """中英混排可用的自動換行（以字元為主），支援 \\n，不會畫出 rect 外"""
     if not wrap:
-        img = font.render(text, True, color)
-        surface.blit(img, (rect.x, rect.y))
+        surface.blit(render_line(font, text, color), (rect.x, rect.y))
         return
 
-    x, y = rect.x, rect.y
-    max_w = rect.w
-    max_h = rect.h
-    line_h = font.get_height() + line_spacing
-
-    paragraphs = text.split("\n")
-    for p_i, para in enumerate(paragraphs):
-        if y > rect.y + max_h - font.get_height():
-            break
-
-        line = ""
-        for ch in para:
-            test = line + ch
-            if font.size(test)[0] <= max_w:
-                line = test
-            else:
-                img = font.render(line, True, color)
-                surface.blit(img, (x, y))
-                y += line_h
-                if y > rect.y + max_h - font.get_height():
-                    return
-                line = ch
+    surface.blits(glyph_cache(font, color).layout(text, rect, line_spacing), doreturn=0)
 
-        if line:
-            img = font.render(line, True, color)
-            surface.blit(img, (x, y))
-            y += line_h
+def _load_yaml_cache(cache_path: str) -> Any:
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
 
-        if p_i != len(paragraphs) - 1:
-            y += int(line_spacing * 0.5)
+def _save_yaml_cache(path: str, cache_path: str, raw: Any) -> None:
+    """寫入解析快取並刪掉舊版本；寫不進去（例如打包後唯讀）就算了"""
+    try:
+        tmp = cache_path + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(raw, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+        for old in glob.glob(glob.escape(path) + ".*.pkl"):
+            if old != cache_path:
+                os.remove(old)
+    except OSError:
+        pass
 
 def load_yaml(path: str) -> Dict[str, Any]:
+    """
+    讀劇本 YAML；解析結果以檔案內容 hash 快取成 <path>.<hash>.pkl，
+    劇本沒改就直接 pickle.load，不用再跑 YAML parser
+    """
     if not os.path.exists(path):
         raise FileNotFoundError(f"找不到劇本檔：{path}")
-    with open(path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+    with open(path, "rb") as f:
+        data = f.read()
+
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    cache_path = f"{path}.{digest}.pkl"
+    raw = _load_yaml_cache(cache_path)
+    if raw is None:
+        raw = yaml.load(data, Loader=SafeLoader)
+        _save_yaml_cache(path, cache_path, raw)
+
     if not isinstance(raw, dict):
         raise ValueError("YAML 最上層必須是 dict（例如 meta/nodes）")
     return raw
 
+_IMG_EXTS = frozenset((".png", ".jpg", ".jpeg", ".webp"))
+
+def bg_path_of(node: Dict[str, Any]) -> Optional[str]:
+    """節點的 bg 欄位 → 相對 assets/ 的圖片路徑（bedroom_bg → bg/bedroom_bg.png）"""
+    bg_key = node.get("bg")
+    if not bg_key:
+        return None
+    bg_key = str(bg_key)
+    if "/" in bg_key or os.path.splitext(bg_key)[1].lower() in _IMG_EXTS:
+        return bg_key.replace("\\", "/")
+    return f"bg/{bg_key}.png"
+
 def safe_join(base: str, rel: str) -> str:
     rel = rel.replace("\\", "/").lstrip("/")
     return os.path.join(base, rel)
@@ -118,6 +248,7 @@ def safe_join(base: str, rel: str) -> str:
 # -------------------------
 # BGM：只找 main_bgm（不管副檔名）
 # -------------------------
+@functools.lru_cache(maxsize=8)
 def find_bgm_file(name_no_ext: str) -> Optional[str]:
     """
     會在以下位置找：
@@ -167,6 +298,47 @@ def try_start_bgm(volume: float) -> None:
 class AssetManager:
     def __init__(self):
         self._img: Dict[str, pygame.Surface] = {}
+        self._img_opaque: Dict[str, pygame.Surface] = {}
+        self._raw: Dict[str, pygame.Surface] = {}  # 背景執行緒解碼好、尚未 convert 的圖
+        self._img_scaled: Dict[Tuple[str, int, int], pygame.Surface] = {}
+        self._sprite_scaled: Dict[Tuple[str, str], pygame.Surface] = {}
+        self._sprite_h = int(SCREEN_H * CHAR_HEIGHT_RATIO)
+
+    def _load(self, key: str) -> pygame.Surface:
+        raw = self._raw.pop(key, None)
+        if raw is not None:
+            return raw
+        full = resource_path(os.path.join("assets", key))
+        if not os.path.exists(full):
+            raise FileNotFoundError(f"找不到圖片：{full}")
+        return pygame.image.load(full)
+
+    def prefetch(self, rel_paths: List[str]) -> threading.Thread:
+        """背景執行緒先把 PNG 從硬碟讀進來解碼；convert 需要顯示器，留給主執行緒"""
+        def work():
+            for rel in rel_paths:
+                key = rel.replace("\\", "/")
+                full = resource_path(os.path.join("assets", key))
+                if key in self._raw or key in self._img or key in self._img_opaque:
+                    continue
+                if not os.path.exists(full):
+                    continue
+                try:
+                    surf = pygame.image.load(full)
+                except pygame.error as e:
+                    print("[提示] 預載圖片失敗：", e)
+                    continue
+                # 解碼期間主執行緒可能已自己讀過這張，就不要再留一份
+                if key not in self._img and key not in self._img_opaque:
+                    self._raw[key] = surf
+
+        t = threading.Thread(target=work, daemon=True)
+        t.start()
+        return t
+
+    def drop_prefetched(self):
+        """預載結束後，沒被取用的解碼圖（主執行緒已另外讀過的重複份）直接丟掉"""
+        self._raw.clear()
 
     def image(self, rel_path: str) -> pygame.Surface:
         """rel_path: 相對於 assets/ 的路徑，如 bg/room.png"""
@@ -174,17 +346,47 @@ class AssetManager:
         if key in self._img:
             return self._img[key]
 
-        full = resource_path(os.path.join("assets", key))
-        if not os.path.exists(full):
-            raise FileNotFoundError(f"找不到圖片：{full}")
-
-        img = pygame.image.load(full).convert_alpha()
+        img = self._load(key).convert_alpha()
         self._img[key] = img
         return img
 
+    def image_opaque(self, rel_path: str) -> pygame.Surface:
+        """不透明版本（背景用）：convert() 轉成螢幕格式，blit 不用逐像素混色"""
+        key = rel_path.replace("\\", "/")
+        if key in self._img_opaque:
+            return self._img_opaque[key]
+
+        img = self._load(key).convert()
+        self._img_opaque[key] = img
+        return img
+
     def image_fit_screen(self, rel_path: str) -> pygame.Surface:
-        img = self.image(rel_path)
-        return pygame.transform.smoothscale(img, (SCREEN_W, SCREEN_H))
+        """縮放到全螢幕（背景用），結果會快取，避免每幀重做 smoothscale"""
+        key = (rel_path.replace("\\", "/"), SCREEN_W, SCREEN_H)
+        if key in self._img_scaled:
+            return self._img_scaled[key]
+
+        img = self.image_opaque(rel_path)
+        scaled = pygame.transform.smoothscale(img, (SCREEN_W, SCREEN_H)).convert()
+        self._img_scaled[key] = scaled
+        return scaled
+
+    def char_sprite_scaled(self, name: str, expression: str) -> pygame.Surface:
+        """ch/<name>/<expression>.png 縮放到立繪高度，結果快取"""
+        key = (name, expression)
+        sprite = self._sprite_scaled.get(key)
+        if sprite is not None:
+            return sprite
+
+        src = self.image(f"ch/{name}/{expression}.png")
+        if src.get_height() == self._sprite_h:
+            # 素材已經是立繪高度，不必 smoothscale
+            sprite = src
+        else:
+            target_w = int(src.get_width() * (self._sprite_h / src.get_height()))
+            sprite = pygame.transform.smoothscale(src, (target_w, self._sprite_h)).convert_alpha()
+        self._sprite_scaled[key] = sprite
+        return sprite
 
 # -------------------------
 # 劇本
@@ -208,6 +410,27 @@ class Script:
         if self.start_id not in self.nodes:
             raise ValueError(f"start id 不存在：{self.start_id}")
 
+        # 劇本用到的所有圖片 / 對白字元（啟動時預載，避免第一次出現時卡頓）
+        self.bg_paths: Set[str] = set()
+        self.char_sprites: Set[Tuple[str, str]] = set()
+        self.text_chars: Set[str] = set()
+        for n in self.nodes.values():
+            if n.get("type", "dialogue") != "choice":
+                self.text_chars.update(str(n.get("text", "")).replace("\n", ""))
+            # 背景路徑、選項 goto→jump 只在載入時整理一次
+            bg = bg_path_of(n)
+            n["_bg_path"] = bg
+            if bg:
+                self.bg_paths.add(bg)
+            for opt in n.get("choices", []) or []:
+                if isinstance(opt, dict) and "jump" not in opt and "goto" in opt:
+                    opt["jump"] = opt["goto"]
+            for c in n.get("ch", []) or []:
+                c["_pos_x_frac"] = CHAR_POS_X_FRAC.get(str(c.get("pos") or "center").strip().lower(), 0.50)
+                name = str(c.get("name", "")).strip()
+                if name:
+                    self.char_sprites.add((name, str(c.get("expression", "normal")).strip()))
+
 # -------------------------
 # VN 引擎
 # -------------------------
@@ -218,49 +441,160 @@ class VNEngine:
         self.assets = assets
         self.script = script
 
-        self.font = pygame.font.SysFont("Microsoft JhengHei", 26)
-        self.font_small = pygame.font.SysFont("Microsoft JhengHei", 22)
-        self.font_name = pygame.font.SysFont("Microsoft JhengHei", 24, bold=True)
+        self.font = get_font(26)
+        self.font_small = get_font(22)
+        self.font_name = get_font(24, bold=True)
 
         self.node_id = script.start_id
-        self.bg_path: Optional[str] = None
+        self._bg_surface: Optional[pygame.Surface] = None
+        self._scene_surface: Optional[pygame.Surface] = None  # 背景 + 靜止立繪合成，換節點才重做
+        self._scene_missing: List[str] = []  # 合成圖裡缺的立繪；沿用合成圖時照樣要持續警告
 
         self.current_name = ""
-        self.current_text = ""
         self.waiting_input = False
 
         self.current_chars: List[Dict[str, Any]] = []
 
-        # typing
+        # 立繪高度固定（縮放結果由 AssetManager 快取）
+        self._char_target_h = int(SCREEN_H * CHAR_HEIGHT_RATIO)
+
+        # typing（全文只排版一次，打字時只截取前 N 個字形來畫）
+        self._text_rect = DIALOGUE_RECT.inflate(-20, -20)
+        self._name_tags: Dict[str, pygame.Surface] = {}
+        self._text_glyphs = glyph_cache(self.font, WHITE)
+        self._prefetch_thread: Optional[threading.Thread] = None
         self._full_text = ""
+        self._type_layout: GlyphLayout = []
         self._shown_len = 0
         self._typing = False
-        self._type_acc = 0.0
+        self._type_acc_ms = 0
+        self._type_ms_per_char = 1000 // TYPE_SPEED_CHARS_PER_SEC
 
         # bounce
         self._bounce_name: Optional[str] = None
-        self._bounce_t = 0.0
+        self._bounce_ms = 0
 
         # choice
         self.choice_active = False
         self.choice_prompt = ""
         self.choice_options: List[Dict[str, Any]] = []
         self.choice_hover = -1
+        self._choice_rects_cache: List[pygame.Rect] = []
+        self._choice_base_y = 0
+        self._choice_label_pos: List[Tuple[int, int]] = []
+        self._choice_prompt_rect = pygame.Rect(0, 0, 0, 0)
 
         # missing warn
         self._missing_sprite_warn: Optional[str] = None
-        self._missing_sprite_warn_t = 0.0
+        self._missing_sprite_warn_ms = 0
 
         # fade
         self.FADE_OUT_SEC = 0.28
         self.FADE_IN_SEC = 0.28
 
+        # 局部更新：只把有變動的區域送到螢幕；整個畫面變了就 flip
+        self._full_redraw = True
+        self._dirty_rects: List[pygame.Rect] = []
+        # 對話框底下的畫面（背景 + 立繪 + 遮罩），打字時只重畫對話框用
+        self._dialogue_backdrop: Optional[pygame.Surface] = None
+        self._warn_rect = pygame.Rect(16, 12, SCREEN_W - 32, 30)
+
+        # MOUSEMOTION 只在選項畫面需要（hover）
+        self._motion_events = True
+
         # volume (0~1)
         self.master_volume = 0.5
 
+        # 靜態 UI（對話框 / 名牌）只畫一次
+        self._panel_surface = self._build_panel(DIALOGUE_RECT.size, (20, 20, 26, 190), 18)
+        self._name_plate_surface = self._build_panel(NAME_RECT.size, (30, 30, 36, 210), 12)
+        self._choice_bg_surface = self._build_button((DIALOGUE_RECT.w, CHOICE_ITEM_H), (220, 220, 225), 14)
+        self._choice_bg_hover_surface = self._build_button((DIALOGUE_RECT.w, CHOICE_ITEM_H), (245, 245, 245), 14)
+
+        # 全螢幕遮罩：黑幕轉場只改 alpha，選項遮罩固定 DIM
+        self._fade_surface = pygame.Surface((SCREEN_W, SCREEN_H)).convert()
+        self._fade_surface.fill(BLACK)
+        # 黑色 alpha=160 蓋上去 == 每個像素乘 (255-160)/255，用 RGB 乘法混色不必逐像素算 alpha
+        dim_k = 255 - DIM[3]
+        self._dim_surface = pygame.Surface((SCREEN_W, SCREEN_H)).convert()
+        self._dim_surface.fill((dim_k, dim_k, dim_k))
+
+        # 固定字串：只 render 一次
+        self._hint_surface = self.font_small.render(HINT_TEXT, True, (200, 200, 200)).convert_alpha()
+        self._btn_font = get_font(22, bold=True)
+        self._btn_labels: Dict[str, pygame.Surface] = {}
+
+    def _name_tag(self, name: str) -> pygame.Surface:
+        """名牌底板 + 名字合成一張，每個說話者只做一次"""
+        tag = self._name_tags.get(name)
+        if tag is None:
+            tag = self._name_plate_surface.copy()
+            tag.blit(render_line(self.font_name, name, WHITE), (7, 5))
+            self._name_tags[name] = tag
+        return tag
+
+    @staticmethod
+    def _build_panel(size: Tuple[int, int], fill: Tuple[int, int, int, int], radius: int) -> pygame.Surface:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(fill)
+        pygame.draw.rect(surf, (255, 255, 255), surf.get_rect(), width=2, border_radius=radius)
+        return surf.convert_alpha()
+
+    @staticmethod
+    def _build_button(size: Tuple[int, int], color: Tuple[int, int, int], radius: int) -> pygame.Surface:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surf, color, surf.get_rect(), border_radius=radius)
+        return surf.convert_alpha()
+
+    def preload_assets(self):
+        """開始預載：圖檔交給背景執行緒解碼（跟封面畫面重疊），字形先 render"""
+        rels = sorted(self.script.bg_paths)
+        rels += [f"ch/{name}/{exp}.png" for name, exp in sorted(self.script.char_sprites)]
+        self._prefetch_thread = self.assets.prefetch(rels)
+
+        # 對白用到的字先 render 進字形快取
+        for ch in sorted(self.script.text_chars):
+            self._text_glyphs.glyph(ch)
+
+    def _finish_preload(self):
+        """等解碼完成，再 convert + 縮放背景與立繪（缺檔留給 draw 時顯示 [缺立繪]）"""
+        if self._prefetch_thread is not None:
+            self._prefetch_thread.join()
+            self._prefetch_thread = None
+        for rel in sorted(self.script.bg_paths):
+            try:
+                self.assets.image_fit_screen(rel)
+            except FileNotFoundError as e:
+                print("[提示] 預載背景失敗：", e)
+        for name, exp in sorted(self.script.char_sprites):
+            try:
+                self._draw_char_sprite(name, exp)
+            except FileNotFoundError:
+                pass
+        self.assets.drop_prefetched()
+
     def _set_missing_warn(self, msg: str):
         self._missing_sprite_warn = msg
-        self._missing_sprite_warn_t = 2.0
+        self._missing_sprite_warn_ms = 2000
+
+    def _mark_dirty(self, rect: Optional[pygame.Rect] = None):
+        """rect=None 代表整個畫面都要重畫"""
+        if rect is None:
+            self._full_redraw = True
+            self._dialogue_backdrop = None
+        else:
+            self._dirty_rects.append(rect)
+            if rect is not DIALOGUE_RECT and rect.colliderect(DIALOGUE_RECT):
+                self._dialogue_backdrop = None
+
+    def _set_motion_events(self, enabled: bool):
+        if enabled == self._motion_events:
+            return
+        self._motion_events = enabled
+        if enabled:
+            pygame.event.set_allowed(pygame.MOUSEMOTION)
+        else:
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
 
     # -------------------------
     # 封面 + 音量設定
@@ -268,8 +602,10 @@ class VNEngine:
     def _draw_button(self, rect: pygame.Rect, text: str, hover: bool):
         pygame.draw.rect(self.screen, (245, 245, 245) if hover else (220, 220, 228), rect, border_radius=16)
         pygame.draw.rect(self.screen, (255, 255, 255), rect, width=2, border_radius=16)
-        f = pygame.font.SysFont("Microsoft JhengHei", 22, bold=True)
-        img = f.render(text, True, (25, 25, 30))
+        img = self._btn_labels.get(text)
+        if img is None:
+            img = self._btn_font.render(text, True, (25, 25, 30)).convert_alpha()
+            self._btn_labels[text] = img
         self.screen.blit(img, img.get_rect(center=rect.center))
 
     def show_volume_screen(self) -> bool:
@@ -278,8 +614,8 @@ class VNEngine:
         ESC / 返回 按鈕：回封面
         """
         W, H = self.screen.get_size()
-        font_title = pygame.font.SysFont("Microsoft JhengHei", 40, bold=True)
-        font_tip = pygame.font.SysFont("Microsoft JhengHei", 20)
+        font_title = get_font(40, bold=True)
+        font_tip = get_font(20)
 
         back_img = self.assets.image_fit_screen("bg/cover_main.png")
 
@@ -294,7 +630,18 @@ class VNEngine:
         btn_back = pygame.Rect(0, 0, 220, 52)
         btn_back.center = (panel.centerx, panel.bottom - 60)
 
+        overlay = pygame.Surface((W, H), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 80))
+
+        title = font_title.render("音量設定", True, WHITE).convert_alpha()
+        title_pos = title.get_rect(center=(panel.centerx, panel.top + 70))
+        tip = font_tip.render("拖曳圓點或點擊白色音量條調整｜ESC 返回", True, (235, 235, 240)).convert_alpha()
+        tip_pos = tip.get_rect(center=(panel.centerx, panel.bottom - 20))
+
         dragging = False
+        # 滑鼠位置跟著事件更新；沒有事件就不重畫
+        mx, my = pygame.mouse.get_pos()
+        dirty = True
 
         def set_vol_from_mouse(mx: int):
             x = clamp(mx, bar.left, bar.right)
@@ -304,9 +651,11 @@ class VNEngine:
 
         while True:
             self.clock.tick(FPS)
-            mx, my = pygame.mouse.get_pos()
 
             for e in pygame.event.get():
+                dirty = True
+                if e.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                    mx, my = e.pos
                 if e.type == pygame.QUIT:
                     return False
                 if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
@@ -326,17 +675,18 @@ class VNEngine:
                 if e.type == pygame.MOUSEMOTION and dragging:
                     set_vol_from_mouse(mx)
 
+            if not dirty:
+                continue
+            dirty = False
+
             # draw
             self.screen.blit(back_img, (0, 0))
-            overlay = pygame.Surface((W, H), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 80))
             self.screen.blit(overlay, (0, 0))
 
             pygame.draw.rect(self.screen, (20, 20, 26), panel, border_radius=18)
             pygame.draw.rect(self.screen, (255, 255, 255), panel, width=2, border_radius=18)
 
-            title = font_title.render("音量設定", True, WHITE)
-            self.screen.blit(title, title.get_rect(center=(panel.centerx, panel.top + 70)))
+            self.screen.blit(title, title_pos)
 
             # bar
             pygame.draw.rect(self.screen, (255, 255, 255), bar, border_radius=8)
@@ -347,14 +697,13 @@ class VNEngine:
             pygame.draw.circle(self.screen, (245, 245, 245), (knob_x, bar.centery), knob_r)
             pygame.draw.circle(self.screen, (40, 40, 50), (knob_x, bar.centery), knob_r, 2)
 
-            vol_text = font_tip.render(f"音量：{int(self.master_volume * 100)}%", True, (230, 230, 235))
+            vol_text = render_line(font_tip, f"音量：{int(self.master_volume * 100)}%", (230, 230, 235))
             self.screen.blit(vol_text, vol_text.get_rect(center=(panel.centerx, bar.bottom + 35)))
 
             hover_back = btn_back.collidepoint(mx, my)
             self._draw_button(btn_back, "返回封面", hover_back)
 
-            tip = font_tip.render("拖曳圓點或點擊白色音量條調整｜ESC 返回", True, (235, 235, 240))
-            self.screen.blit(tip, tip.get_rect(center=(panel.centerx, panel.bottom - 20)))
+            self.screen.blit(tip, tip_pos)
 
             pygame.display.flip()
 
@@ -369,7 +718,7 @@ class VNEngine:
         """
         W, H = self.screen.get_size()
         cover_img = self.assets.image_fit_screen("bg/cover_main.png")
-        tip_font = pygame.font.SysFont("Microsoft JhengHei", 16)
+        tip_font = get_font(16)
 
         # 按鈕：更小
         bw, bh = 240, 40
@@ -384,11 +733,27 @@ class VNEngine:
         btn_start.center = (W // 2, base_y)
         btn_volume.center = (W // 2, base_y + bh + gap)
 
+        # 靜態部分（背景 + 遮罩 + 提示字）先合成一張，迴圈內只畫按鈕
+        overlay = pygame.Surface((W, H), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 45))
+        tip = tip_font.render("Enter / Space 也可開始｜ESC 離開", True, (235, 235, 240))
+
+        cover_static = cover_img.copy()
+        cover_static.blit(overlay, (0, 0))
+        cover_static.blit(tip, tip.get_rect(center=(W // 2, btn_volume.bottom + 20)))
+        cover_static = cover_static.convert()
+
+        # 滑鼠位置跟著事件更新；沒有事件就不重畫
+        mx, my = pygame.mouse.get_pos()
+        dirty = True
+
         while True:
             self.clock.tick(FPS)
-            mx, my = pygame.mouse.get_pos()
 
             for e in pygame.event.get():
+                dirty = True
+                if e.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                    mx, my = e.pos
                 if e.type == pygame.QUIT:
                     return False
                 if e.type == pygame.KEYDOWN:
@@ -403,18 +768,17 @@ class VNEngine:
                         ok = self.show_volume_screen()
                         if not ok:
                             return False
+                        mx, my = pygame.mouse.get_pos()
 
-            self.screen.blit(cover_img, (0, 0))
-            overlay = pygame.Surface((W, H), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 45))
-            self.screen.blit(overlay, (0, 0))
+            if not dirty:
+                continue
+            dirty = False
+
+            self.screen.blit(cover_static, (0, 0))
 
             self._draw_button(btn_start, "點擊後進入遊戲", btn_start.collidepoint(mx, my))
             self._draw_button(btn_volume, "音量設定", btn_volume.collidepoint(mx, my))
 
-            tip = tip_font.render("Enter / Space 也可開始｜ESC 離開", True, (235, 235, 240))
-            self.screen.blit(tip, tip.get_rect(center=(W // 2, btn_volume.bottom + 20)))
-
             pygame.display.flip()
 
     # -------------------------
@@ -424,57 +788,59 @@ class VNEngine:
         self.script.nodes["__END__"] = {"id": "__END__", "type": "end", "text": text}
 
     def _resolve_bg_path_from_node(self, node: Dict[str, Any]) -> Optional[str]:
-        bg_key = node.get("bg")
-        if not bg_key:
-            return None
-        bg_key = str(bg_key)
-        if "/" in bg_key or bg_key.lower().endswith((".png", ".jpg", ".jpeg", ".webp")):
-            return bg_key.replace("\\", "/")
-        return f"bg/{bg_key}.png"
+        return node.get("_bg_path")
 
     # -------------------------
     # 黑幕轉場
     # -------------------------
     def _fade_to_black(self, seconds: float) -> bool:
+        # 轉場期間畫面不會變：先畫一次存起來，每幀只疊黑幕
+        self.draw()
+        snapshot = self.screen.copy()
+
         t = 0.0
         while t < seconds:
             dt = self.clock.tick(FPS) / 1000.0
             t += dt
 
-            for e in pygame.event.get():
+            for e in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
                 if e.type == pygame.QUIT:
                     return False
-                if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
+                if e.key == pygame.K_ESCAPE:
                     return False
+            pygame.event.clear(pump=False)
 
-            self.draw()
+            self.screen.blit(snapshot, (0, 0))
             a = int(255 * min(1.0, t / seconds))
-            overlay = pygame.Surface((SCREEN_W, SCREEN_H))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(a)
-            self.screen.blit(overlay, (0, 0))
+            self._fade_surface.set_alpha(a)
+            self.screen.blit(self._fade_surface, (0, 0))
             pygame.display.flip()
+        self._mark_dirty()
         return True
 
     def _fade_from_black(self, seconds: float) -> bool:
+        # 轉場期間畫面不會變：先畫一次存起來，每幀只疊黑幕
+        self.draw()
+        snapshot = self.screen.copy()
+
         t = 0.0
         while t < seconds:
             dt = self.clock.tick(FPS) / 1000.0
             t += dt
 
-            for e in pygame.event.get():
+            for e in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
                 if e.type == pygame.QUIT:
                     return False
-                if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
+                if e.key == pygame.K_ESCAPE:
                     return False
+            pygame.event.clear(pump=False)
 
-            self.draw()
+            self.screen.blit(snapshot, (0, 0))
             a = int(255 * max(0.0, 1.0 - (t / seconds)))
-            overlay = pygame.Surface((SCREEN_W, SCREEN_H))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(a)
-            self.screen.blit(overlay, (0, 0))
+            self._fade_surface.set_alpha(a)
+            self.screen.blit(self._fade_surface, (0, 0))
             pygame.display.flip()
+        self._mark_dirty()
         return True
 
     def _go_to_node(self, node_id: str):
@@ -525,77 +891,81 @@ class VNEngine:
             raise KeyError(f"找不到節點：{node_id}")
 
         self.node_id = node_id
+        self._mark_dirty()
         self.current_name = ""
-        self.current_text = ""
         self.waiting_input = False
 
         self.choice_active = False
         self.choice_prompt = ""
         self.choice_options = []
         self.choice_hover = -1
+        self._choice_rects_cache = []
         self.current_chars = []
+        self._scene_surface = None
+        self._scene_missing = []
 
         self._full_text = ""
+        self._type_layout = []
         self._shown_len = 0
         self._typing = False
-        self._type_acc = 0.0
+        self._type_acc_ms = 0
 
         self._bounce_name = None
-        self._bounce_t = 0.0
+        self._bounce_ms = 0
 
     def _start_typing(self, full_text: str):
         self._full_text = full_text
+        self._type_layout = self._text_glyphs.layout(full_text, self._text_rect)
         self._shown_len = 0
         self._typing = True
-        self._type_acc = 0.0
-        self.current_text = ""
+        self._type_acc_ms = 0
 
     def _finish_typing(self):
+        self._mark_dirty(DIALOGUE_RECT)
         self._typing = False
         self._shown_len = len(self._full_text)
-        self.current_text = self._full_text
 
-    def _update_typing(self, dt: float):
+    def _update_typing(self, dt_ms: int):
         if not self._typing:
             return
-        self._type_acc += dt
-        add = int(self._type_acc * TYPE_SPEED_CHARS_PER_SEC)
+        self._type_acc_ms += dt_ms
+        add, self._type_acc_ms = divmod(self._type_acc_ms, self._type_ms_per_char)
         if add > 0:
-            self._type_acc -= add / TYPE_SPEED_CHARS_PER_SEC
-            self._shown_len = min(len(self._full_text), self._shown_len + add)
-            self.current_text = self._full_text[: self._shown_len]
-            if self._shown_len >= len(self._full_text):
+            self._mark_dirty(DIALOGUE_RECT)
+            n = len(self._full_text)
+            self._shown_len += add
+            if self._shown_len >= n:
+                self._shown_len = n
                 self._typing = False
 
     def _start_bounce_if_needed(self):
         spk = (self.current_name or "").strip()
         if not spk or spk.upper() == "NARRATOR":
             self._bounce_name = None
-            self._bounce_t = 0.0
+            self._bounce_ms = 0
             return
 
         for c in self.current_chars:
             if str(c.get("name", "")).strip() == spk:
                 self._bounce_name = spk
-                self._bounce_t = 0.0
+                self._bounce_ms = 0
                 return
 
         self._bounce_name = None
-        self._bounce_t = 0.0
+        self._bounce_ms = 0
 
     def next_step(self):
+        self._mark_dirty()
         node = self.script.nodes[self.node_id]
         t = str(node.get("type", "dialogue"))
 
         self.current_chars = node.get("ch", []) or []
+        self._scene_surface = None
+        self._scene_missing = []
 
-        bg_key = node.get("bg")
-        if bg_key:
-            bg_key = str(bg_key)
-            if "/" in bg_key or bg_key.lower().endswith((".png", ".jpg", ".jpeg", ".webp")):
-                self.bg_path = bg_key
-            else:
-                self.bg_path = f"bg/{bg_key}.png"
+        bg_path = node.get("_bg_path")
+        if bg_path:
+            self._bg_surface = self.assets.image_fit_screen(bg_path)
 
         if t == "end":
             self.current_name = ""
@@ -617,6 +987,7 @@ class VNEngine:
                 raise ValueError(f"未知 goto_minigame：{node['goto_minigame']}（只支援 1/2/3）")
 
             # (小遊戲本身會處理 return True/False)
+            self._set_motion_events(True)
             _passed = MINIGAMES[mg_id].run(self.screen, self.clock, self.font_small)
 
             nxt = node.get("next")
@@ -644,9 +1015,21 @@ class VNEngine:
             if not isinstance(self.choice_options, list) or len(self.choice_options) == 0:
                 raise ValueError(f"choice 節點 {self.node_id} choices 必須是 list 且不可為空")
 
-            for opt in self.choice_options:
-                if "jump" not in opt and "goto" in opt:
-                    opt["jump"] = opt["goto"]
+            # 選項數固定，框位置只算一次
+            base_x = DIALOGUE_RECT.x
+            base_y = DIALOGUE_RECT.y - (CHOICE_ITEM_H + 10) * len(self.choice_options) - 18
+            self._choice_base_y = base_y
+            self._choice_rects_cache = [
+                pygame.Rect(base_x, base_y + i * (CHOICE_ITEM_H + 10), DIALOGUE_RECT.w, CHOICE_ITEM_H)
+                for i in range(len(self.choice_options))
+            ]
+            self._choice_label_pos = [r.inflate(-18, -12).topleft for r in self._choice_rects_cache]
+            self._choice_prompt_rect = pygame.Rect(
+                base_x,
+                DIALOGUE_RECT.y - 40 - (CHOICE_ITEM_H + 10) * len(self.choice_options) - 16,
+                DIALOGUE_RECT.w,
+                40,
+            )
 
             self.choice_active = True
             self.waiting_input = True
@@ -657,154 +1040,175 @@ class VNEngine:
         raise ValueError(f"不支援的節點 type：{t}（node id={self.node_id}）")
 
     def _choice_item_rects(self) -> List[pygame.Rect]:
-        base_x = DIALOGUE_RECT.x
-        base_y = DIALOGUE_RECT.y - (CHOICE_ITEM_H + 10) * len(self.choice_options) - 18
-        return [
-            pygame.Rect(base_x, base_y + i * (CHOICE_ITEM_H + 10), DIALOGUE_RECT.w, CHOICE_ITEM_H)
-            for i in range(len(self.choice_options))
-        ]
+        return self._choice_rects_cache
+
+    def _choice_index_at(self, pos: Tuple[int, int]) -> int:
+        """選項等高等距排列，直接用座標算出第幾項；落在間隙或框外回傳 -1。"""
+        x, y = pos
+        if not (DIALOGUE_RECT.x <= x < DIALOGUE_RECT.right):
+            return -1
+        dy = y - self._choice_base_y
+        if dy < 0:
+            return -1
+        idx, off = divmod(dy, CHOICE_ITEM_H + 10)
+        if off >= CHOICE_ITEM_H or idx >= len(self._choice_rects_cache):
+            return -1
+        return idx
 
     def handle_choice_click(self, pos: Tuple[int, int]):
         if not self.choice_active:
             return
-        for idx, rect in enumerate(self._choice_item_rects()):
-            if rect.collidepoint(pos):
-                jump = self.choice_options[idx].get("jump")
-                if not jump:
-                    raise ValueError("choice option 缺少 goto/jump")
-                self.choice_active = False
-                ok = self._transition_to_node(str(jump), force=False)
-                if not ok:
-                    pygame.quit()
-                    sys.exit(0)
-                return
+        idx = self._choice_index_at(pos)
+        if idx < 0:
+            return
+        jump = self.choice_options[idx].get("jump")
+        if not jump:
+            raise ValueError("choice option 缺少 goto/jump")
+        self.choice_active = False
+        ok = self._transition_to_node(str(jump), force=False)
+        if not ok:
+            pygame.quit()
+            sys.exit(0)
 
     def update_hover(self, pos: Tuple[int, int]):
-        self.choice_hover = -1
-        if not self.choice_active:
-            return
-        for i, rect in enumerate(self._choice_item_rects()):
-            if rect.collidepoint(pos):
-                self.choice_hover = i
-                return
+        prev = self.choice_hover
+        self.choice_hover = self._choice_index_at(pos) if self.choice_active else -1
+        if self.choice_hover != prev:
+            rects = self._choice_item_rects()
+            for i in (prev, self.choice_hover):
+                if 0 <= i < len(rects):
+                    self._mark_dirty(rects[i])
 
     def _draw_char_sprite(self, name: str, expression: str) -> pygame.Surface:
-        rel = f"ch/{name}/{expression}.png"
-        return self.assets.image(rel)
+        return self.assets.char_sprite_scaled(name, expression)
 
-    def _char_pos_x(self, pos: str, w: int) -> int:
-        pos = (pos or "center").lower()
-        if pos == "left":
-            return int(SCREEN_W * 0.23 - w / 2)
-        if pos == "right":
-            return int(SCREEN_W * 0.77 - w / 2)
-        return int(SCREEN_W * 0.50 - w / 2)
+    def _char_pos_x(self, frac: float, w: int) -> int:
+        return int(SCREEN_W * frac - w / 2)
+
+    def _bounce_rect(self) -> Optional[pygame.Rect]:
+        """跳動中角色的範圍（含跳起高度），給局部更新用"""
+        area: Optional[pygame.Rect] = None
+        for c in self.current_chars:
+            name = str(c.get("name", "")).strip()
+            if name != self._bounce_name:
+                continue
+            try:
+                sprite = self._draw_char_sprite(name, str(c.get("expression", "normal")).strip())
+            except FileNotFoundError:
+                continue
+            w = sprite.get_width()
+            x = self._char_pos_x(c.get("_pos_x_frac", 0.50), w)
+            y = SCREEN_H - self._char_target_h - CHAR_BOTTOM_PAD - BOUNCE_HEIGHT
+            r = pygame.Rect(x, y, w, self._char_target_h + BOUNCE_HEIGHT)
+            area = r if area is None else area.union(r)
+        return area
+
+    # 跳動曲線查表：sin 半週期切成 128 段
+    _BOUNCE_LUT = [int(-math.sin(i / 128 * math.pi) * BOUNCE_HEIGHT) for i in range(129)]
 
     def _bounce_offset(self, char_name: str) -> int:
         if not self._bounce_name or self._bounce_name != char_name:
             return 0
-        t = self._bounce_t
-        if t < 0 or t > BOUNCE_DURATION:
+        t = self._bounce_ms
+        if t > BOUNCE_DURATION_MS:
             return 0
-        phase = (t / BOUNCE_DURATION) * math.pi
-        return int(-math.sin(phase) * BOUNCE_HEIGHT)
+        return self._BOUNCE_LUT[t * 128 // BOUNCE_DURATION_MS]
 
-    def draw(self):
+    def _draw_scene(self, target: pygame.Surface) -> List[str]:
+        """畫背景 + 立繪；回傳缺圖的訊息"""
         # background
-        if self.bg_path:
-            bg = self.assets.image_fit_screen(self.bg_path)
-            self.screen.blit(bg, (0, 0))
+        if self._bg_surface is not None:
+            target.blit(self._bg_surface, (0, 0))
         else:
-            self.screen.fill((16, 18, 22))
+            target.fill((16, 18, 22))
 
-        # characters
+        # characters（一次 blits 畫完）
+        sprite_batch = []
+        missing: List[str] = []
+        base_y = SCREEN_H - self._char_target_h - CHAR_BOTTOM_PAD
         for c in self.current_chars:
             try:
                 name = str(c.get("name", "")).strip()
                 if not name:
                     continue
-                pos = str(c.get("pos", "center")).strip()
                 exp = str(c.get("expression", "normal")).strip()
 
                 sprite = self._draw_char_sprite(name, exp)
 
-                target_h = int(SCREEN_H * CHAR_HEIGHT_RATIO)
-                scale = target_h / sprite.get_height()
-                target_w = int(sprite.get_width() * scale)
-                sprite_s = pygame.transform.smoothscale(sprite, (target_w, target_h))
+                x = self._char_pos_x(c.get("_pos_x_frac", 0.50), sprite.get_width())
+                y = base_y + self._bounce_offset(name)
 
-                x = self._char_pos_x(pos, target_w)
-                y = SCREEN_H - target_h - CHAR_BOTTOM_PAD
-                y += self._bounce_offset(name)
-
-                self.screen.blit(sprite_s, (x, y))
+                sprite_batch.append((sprite, (x, y)))
             except FileNotFoundError as e:
-                self._set_missing_warn(str(e))
+                missing.append(str(e))
+        target.blits(sprite_batch, doreturn=0)
+        return missing
+
+    def draw(self):
+        # 跳動中才逐張畫立繪；其餘時間背景 + 立繪是同一張合成圖
+        if self._bounce_name:
+            missing = self._draw_scene(self.screen)
+        else:
+            if self._scene_surface is None:
+                self._scene_surface = pygame.Surface((SCREEN_W, SCREEN_H)).convert()
+                self._scene_missing = self._draw_scene(self._scene_surface)
+            self.screen.blit(self._scene_surface, (0, 0))
+            missing = self._scene_missing
+        # 缺圖期間每次重畫都重新計時，警告不會在 2 秒後消失
+        for msg in missing:
+            self._set_missing_warn(msg)
+            self._mark_dirty(self._warn_rect)
 
         # choice overlay
         if self.choice_active:
-            overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-            overlay.fill(DIM)
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._dim_surface, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
 
-            prompt_rect = pygame.Rect(
-                DIALOGUE_RECT.x,
-                DIALOGUE_RECT.y - 40 - (CHOICE_ITEM_H + 10) * len(self.choice_options) - 16,
-                DIALOGUE_RECT.w,
-                40,
-            )
-            draw_text(self.screen, self.font_name, self.choice_prompt, WHITE, prompt_rect, wrap=False)
+            draw_text(self.screen, self.font_name, self.choice_prompt, WHITE, self._choice_prompt_rect, wrap=False)
 
+            buttons = []
+            labels = []
             for i, rect in enumerate(self._choice_item_rects()):
                 is_hover = (i == self.choice_hover)
-                pygame.draw.rect(
-                    self.screen,
-                    (245, 245, 245) if is_hover else (220, 220, 225),
-                    rect,
-                    border_radius=14,
-                )
+                buttons.append((self._choice_bg_hover_surface if is_hover else self._choice_bg_surface, rect.topleft))
                 txt = str(self.choice_options[i].get("text", f"選項 {i+1}"))
-                draw_text(self.screen, self.font, txt, BLACK, rect.inflate(-18, -12), wrap=False)
+                labels.append((render_line(self.font, txt, BLACK), self._choice_label_pos[i]))
+            self.screen.blits(buttons + labels, doreturn=0)
 
         # dialogue panel
         if self.waiting_input:
-            panel = pygame.Surface((DIALOGUE_RECT.w, DIALOGUE_RECT.h), pygame.SRCALPHA)
-            panel.fill((20, 20, 26, 190))
-            self.screen.blit(panel, (DIALOGUE_RECT.x, DIALOGUE_RECT.y))
-            pygame.draw.rect(self.screen, (255, 255, 255), DIALOGUE_RECT, width=2, border_radius=18)
+            if self._dialogue_backdrop is None:
+                self._dialogue_backdrop = self.screen.subsurface(DIALOGUE_RECT).copy()
+            self._draw_dialogue_box()
 
             if self.current_name:
-                name_panel = pygame.Surface((NAME_RECT.w, NAME_RECT.h), pygame.SRCALPHA)
-                name_panel.fill((30, 30, 36, 210))
-                self.screen.blit(name_panel, (NAME_RECT.x, NAME_RECT.y))
-                pygame.draw.rect(self.screen, (255, 255, 255), NAME_RECT, width=2, border_radius=12)
-                draw_text(self.screen, self.font_name, self.current_name, WHITE, NAME_RECT.inflate(-14, -10), wrap=False)
-
-            text_rect = DIALOGUE_RECT.inflate(-20, -20)
-            draw_text(self.screen, self.font, self.current_text, WHITE, text_rect, wrap=True)
-
-            hint = "（左鍵 / Enter：若還在打字→直接顯示全文；否則→下一句｜ESC 離開）"
-            draw_text(
-                self.screen,
-                self.font_small,
-                hint,
-                (200, 200, 200),
-                pygame.Rect(DIALOGUE_RECT.x, DIALOGUE_RECT.bottom - 28, DIALOGUE_RECT.w, 24),
-                wrap=False,
-            )
+                self.screen.blit(self._name_tag(self.current_name), NAME_RECT.topleft)
 
         # missing warning
-        if self._missing_sprite_warn and self._missing_sprite_warn_t > 0:
-            warn_rect = pygame.Rect(16, 12, SCREEN_W - 32, 30)
+        if self._missing_sprite_warn and self._missing_sprite_warn_ms > 0:
             draw_text(
                 self.screen,
                 self.font_small,
                 f"[缺立繪] {self._missing_sprite_warn}",
                 (255, 140, 140),
-                warn_rect,
+                self._warn_rect,
                 wrap=False,
             )
 
+    def _draw_dialogue_box(self):
+        # 換行符號不佔字形，要從已顯示字數扣掉
+        n = self._shown_len - self._full_text.count("\n", 0, self._shown_len)
+
+        # 底板、字形、提示一次 blits 送出
+        batch = [(self._panel_surface, DIALOGUE_RECT.topleft)]
+        batch += self._type_layout[:n]
+        batch.append((self._hint_surface, (DIALOGUE_RECT.x, DIALOGUE_RECT.bottom - 28)))
+        self.screen.blits(batch, doreturn=0)
+
+    def draw_dialogue_only(self):
+        """只有對話框內容變了（打字中）：底圖用快取，不重畫整個場景"""
+        self.screen.blit(self._dialogue_backdrop, DIALOGUE_RECT.topleft)
+        self._draw_dialogue_box()
+
     def _advance(self) -> bool:
         if self._typing:
             self._finish_typing()
@@ -824,31 +1228,49 @@ class VNEngine:
         if not self.show_cover_screen():
             pygame.quit()
             return
+        self._finish_preload()
 
         self.next_step()
 
         running = True
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            dt_ms = self.clock.tick(FPS)
 
-            self._update_typing(dt)
+            self._update_typing(dt_ms)
 
             if self._bounce_name:
-                self._bounce_t += dt
-                if self._bounce_t > BOUNCE_DURATION:
+                bounce_rect = self._bounce_rect()
+                if bounce_rect is not None:
+                    self._mark_dirty(bounce_rect)
+                self._bounce_ms += dt_ms
+                if self._bounce_ms > BOUNCE_DURATION_MS:
                     self._bounce_name = None
-                    self._bounce_t = 0.0
+                    self._bounce_ms = 0
 
-            if self._missing_sprite_warn_t > 0:
-                self._missing_sprite_warn_t = max(0.0, self._missing_sprite_warn_t - dt)
+            if self._missing_sprite_warn_ms > 0:
+                self._missing_sprite_warn_ms = max(0, self._missing_sprite_warn_ms - dt_ms)
+                self._mark_dirty(self._warn_rect)
 
-            for e in pygame.event.get():
+            self._set_motion_events(self.choice_active)
+
+            # 只取需要的事件；KEYUP / TEXTINPUT / 其他視窗事件直接清掉，不建 Python 物件
+            events = pygame.event.get(
+                (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED)
+            )
+            # 不要再 pump：get 之後才進來的 QUIT / 按鍵留到下一幀處理
+            pygame.event.clear(pump=False)
+            motion_pos = None
+            for e in events:
                 if e.type == pygame.QUIT:
                     running = False
                 elif e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
                     running = False
                 elif e.type == pygame.MOUSEMOTION:
-                    self.update_hover(e.pos)
+                    # 一幀內的多筆移動只看最後一筆
+                    motion_pos = e.pos
+                elif e.type == pygame.WINDOWEXPOSED:
+                    # 視窗被遮住 / 縮小後重新露出：局部更新補不回來，整個重畫
+                    self._mark_dirty()
                 elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
                     if self.choice_active:
                         self.handle_choice_click(e.pos)
@@ -862,8 +1284,24 @@ class VNEngine:
                         if not self._advance():
                             running = False
 
-            self.draw()
-            pygame.display.flip()
+            if motion_pos is not None:
+                self.update_hover(motion_pos)
+
+            if self._full_redraw:
+                self.draw()
+                pygame.display.flip()
+            elif self._dirty_rects:
+                if (
+                    self._dialogue_backdrop is not None
+                    and self.waiting_input
+                    and all(r is DIALOGUE_RECT for r in self._dirty_rects)
+                ):
+                    self.draw_dialogue_only()
+                else:
+                    self.draw()
+                pygame.display.update(self._dirty_rects)
+            self._full_redraw = False
+            self._dirty_rects = []
 
         pygame.quit()
 
@@ -894,6 +1332,7 @@ def main():
 
     assets = AssetManager()
     engine = VNEngine(screen, clock, assets, script)
+    engine.preload_assets()
 
     # ✅ BGM：封面就播放，進遊戲不換，循環播放
     try_start_bgm(engine.master_volume)
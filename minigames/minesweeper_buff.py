@@ -1,11 +1,26 @@
 # minigames/minesweeper_buff.py
 import sys
 import random
-from typing import List, Tuple, Optional, Set
+from typing import Dict, List, Tuple, Optional, Set
 
 import pygame
 
 
+# SysFont 每次都會查字型檔並重新解析；重開遊戲時沿用同一個 Font
+_FONT_CACHE: Dict[Tuple[str, int, bool], pygame.font.Font] = {}
+
+
+def _font(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    key = (name, size, bold)
+    f = _FONT_CACHE.get(key)
+    if f is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        f = pygame.font.SysFont(name, size, bold=bold)
+        _FONT_CACHE[key] = f
+    return f
+
+
 class MinesweeperBuffGame:
     name = "mg2"
 
@@ -57,10 +72,10 @@ class MinesweeperBuffGame:
         LOCK_EDGE = (160, 90, 220)
 
         # fonts
-        font_big = pygame.font.SysFont("Microsoft JhengHei", 42, bold=True)
-        font_mid = pygame.font.SysFont("Microsoft JhengHei", 24, bold=True)
-        font_small = pygame.font.SysFont("Microsoft JhengHei", 20)
-        font_num = pygame.font.SysFont("Microsoft JhengHei", 26, bold=True)
+        font_big = _font("Microsoft JhengHei", 42, bold=True)
+        font_mid = _font("Microsoft JhengHei", 24, bold=True)
+        font_small = _font("Microsoft JhengHei", 20)
+        font_num = _font("Microsoft JhengHei", 26, bold=True)
 
         # -------------- helpers --------------
         def in_bounds(c: int, r: int) -> bool:
@@ -78,23 +93,26 @@ class MinesweeperBuffGame:
                     if in_bounds(nc, nr):
                         yield nc, nr
 
+        # 每格的鄰居只算一次
+        NEIGHBORS: Dict[Tuple[int, int], List[Tuple[int, int]]] = {
+            (c, r): list(neighbors8(c, r)) for r in range(ROWS) for c in range(COLS)
+        }
+
         def toast(msg: str, seconds: float):
-            nonlocal toast_msg, toast_t
+            nonlocal toast_msg, toast_t, needs_redraw
             toast_msg = msg
             toast_t = seconds
+            needs_redraw = True
 
         def recompute_numbers():
-            # 只看目前還存在的炸彈
-            for rr in range(ROWS):
-                for cc in range(COLS):
-                    if (cc, rr) in bombs_current:
-                        numbers[rr][cc] = -1
-                    else:
-                        cnt = 0
-                        for nc, nr in neighbors8(cc, rr):
-                            if (nc, nr) in bombs_current:
-                                cnt += 1
-                        numbers[rr][cc] = cnt
+            # 只看目前還存在的炸彈：從每顆炸彈往鄰居 +1（20 顆 x 8），不用每格掃 8 鄰
+            counts = [[0] * COLS for _ in range(ROWS)]
+            for pos in bombs_current:
+                for nc, nr in NEIGHBORS[pos]:
+                    counts[nr][nc] += 1
+            for cc, rr in bombs_current:
+                counts[rr][cc] = -1
+            numbers[:] = counts
 
         def spawn_bombs(first_click: Optional[Tuple[int, int]] = None):
             forbidden: Set[Tuple[int, int]] = set()
@@ -105,15 +123,13 @@ class MinesweeperBuffGame:
                     forbidden.add((nc, nr))
 
             pool = [(c, r) for r in range(ROWS) for c in range(COLS) if (c, r) not in forbidden]
-            random.shuffle(pool)
-            return set(pool[:BOMBS_INIT])
+            return set(random.sample(pool, min(BOMBS_INIT, len(pool))))
 
         def pick_buff_cells():
             safe = [(c, r) for r in range(ROWS) for c in range(COLS) if (c, r) not in bombs_current]
-            random.shuffle(safe)
-            reveal_cells = set(safe[:BUFF_REVEAL_BURIED])
+            reveal_cells = set(random.sample(safe, min(BUFF_REVEAL_BURIED, len(safe))))
             rest = [x for x in safe if x not in reveal_cells]
-            blast_cells = set(rest[:BUFF_BLAST_BURIED])
+            blast_cells = set(random.sample(rest, min(BUFF_BLAST_BURIED, len(rest))))
             return reveal_cells, blast_cells
 
         def collect_buff(c: int, r: int):
@@ -132,26 +148,24 @@ class MinesweeperBuffGame:
                 toast("獲得 Buff：爆破 +1（Space 切換爆破模式）", TOAST_NORMAL)
 
         def flood_open(start_c: int, start_r: int):
+            # 查表取鄰居；已排進 stack 的格子記在 seen，不會重複推入
             stack = [(start_c, start_r)]
+            seen = {(start_c, start_r)}
             while stack:
-                c, r = stack.pop()
-                if opened[r][c]:
-                    continue
-                if flagged[r][c]:
-                    continue
-                if locked_cell is not None and (c, r) == locked_cell:
+                pos = stack.pop()
+                c, r = pos
+                if opened[r][c] or flagged[r][c] or pos == locked_cell:
                     continue
 
                 opened[r][c] = True
                 collect_buff(c, r)
 
                 if numbers[r][c] == 0:
-                    for nc, nr in neighbors8(c, r):
-                        if not opened[nr][nc] and not flagged[nr][nc]:
-                            if locked_cell is not None and (nc, nr) == locked_cell:
-                                continue
-                            if (nc, nr) not in bombs_current:
-                                stack.append((nc, nr))
+                    for npos in NEIGHBORS[pos]:
+                        if npos in seen or npos in bombs_current:
+                            continue
+                        seen.add(npos)
+                        stack.append(npos)
 
         def use_reveal(auto: bool = False):
             nonlocal reveal_left
@@ -218,27 +232,16 @@ class MinesweeperBuffGame:
             flash_t = max(flash_t, 0.12)
 
         def opened_safe_count() -> int:
-            cnt = 0
-            for r in range(ROWS):
-                for c in range(COLS):
-                    if opened[r][c] and (c, r) not in bombs_current:
-                        cnt += 1
-            return cnt
+            # 每列用 list.count（C 迴圈）數已翻格，再扣掉翻開的炸彈（踩到的那幾顆）
+            cnt = sum(row.count(True) for row in opened)
+            return cnt - sum(1 for c, r in bombs_current if opened[r][c])
 
         def total_safe_cells() -> int:
             return COLS * ROWS - len(bombs_current)
 
         def safe_left_unopened() -> int:
             """剩下還沒翻開的安全格數量（用於尾盤不封鎖）"""
-            left = 0
-            for r in range(ROWS):
-                for c in range(COLS):
-                    if opened[r][c]:
-                        continue
-                    if (c, r) in bombs_current:
-                        continue
-                    left += 1
-            return left
+            return total_safe_cells() - opened_safe_count()
 
         def list_unopened_safe_cells() -> List[Tuple[int, int]]:
             cells = []
@@ -260,14 +263,77 @@ class MinesweeperBuffGame:
             pygame.draw.line(screen, (20, 20, 25), (cx + radius - 2, cy - radius + 2), (cx + radius + 10, cy - radius - 10), 3)
             pygame.draw.circle(screen, (255, 120, 120), (cx + radius + 12, cy - radius - 12), 4)
 
-        def draw_lock_icon(rect: pygame.Rect):
+        def draw_lock_icon(surface: pygame.Surface, rect: pygame.Rect):
             cx, cy = rect.center
             body = pygame.Rect(0, 0, int(rect.w * 0.38), int(rect.h * 0.32))
             body.center = (cx, cy + int(rect.h * 0.06))
-            pygame.draw.rect(screen, (235, 235, 245), body, border_radius=6)
+            pygame.draw.rect(surface, (235, 235, 245), body, border_radius=6)
             arc = pygame.Rect(0, 0, int(rect.w * 0.34), int(rect.h * 0.34))
             arc.center = (cx, cy - int(rect.h * 0.03))
-            pygame.draw.arc(screen, (235, 235, 245), arc, 3.45, 5.97, 4)
+            pygame.draw.arc(surface, (235, 235, 245), arc, 3.45, 5.97, 4)
+
+        # -------------- tile cache --------------
+        # 每種格子外觀先畫好一張，draw_board 只挑一張 blit
+        tile_box = pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE).inflate(-2, -2)
+
+        def make_tile(color) -> pygame.Surface:
+            surf = pygame.Surface(tile_box.size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, surf.get_rect(), border_radius=6)
+            return surf
+
+        tile_cache: Dict[str, pygame.Surface] = {}
+        tile_cache["closed"] = make_tile(TILE_CLOSED).convert_alpha()
+
+        flag = make_tile(TILE_CLOSED)
+        pygame.draw.rect(flag, TILE_FLAG, flag.get_rect().inflate(-12, -12), border_radius=6)
+        tile_cache["flag"] = flag.convert_alpha()
+
+        for n in range(9):
+            tile = make_tile(TILE_OPEN)
+            if n > 0:
+                img = font_num.render(str(n), True, (30, 30, 36))
+                tile.blit(img, img.get_rect(center=tile.get_rect().center))
+            tile_cache[f"open_{n}"] = tile.convert_alpha()
+
+        # 封鎖：半透明遮罩 + 紫框 + 鎖頭，疊在格子上面
+        lock = pygame.Surface(tile_box.size, pygame.SRCALPHA)
+        lock.fill(LOCK_OVERLAY)
+        pygame.draw.rect(lock, LOCK_EDGE, lock.get_rect(), width=3, border_radius=6)
+        draw_lock_icon(lock, lock.get_rect())
+        tile_cache["lock"] = lock.convert_alpha()
+
+        # 每格 tile 的左上角，draw_board 直接查表
+        tile_pos = [
+            [(board_x + c * GRID_SIZE + tile_box.x, board_y + r * GRID_SIZE + tile_box.y) for c in range(COLS)]
+            for r in range(ROWS)
+        ]
+
+        # 紅閃 / 結算遮罩尺寸固定，開場配一次就好
+        flash_surf = pygame.Surface((board_w, board_h), pygame.SRCALPHA)
+        flash_surf.fill((FLASH[0], FLASH[1], FLASH[2], 70))
+        flash_surf = flash_surf.convert_alpha()
+        result_overlay = pygame.Surface((W, H), pygame.SRCALPHA)
+        result_overlay.fill((0, 0, 0, 160))
+        result_overlay = result_overlay.convert_alpha()
+
+        TEXT_CACHE_MAX = 64
+        text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+
+        def render_text(f: pygame.font.Font, text: str, col) -> pygame.Surface:
+            # HUD 字串大多幀幀相同，同一串只 render 一次；倒數秒數會一直變，滿了就整包清掉
+            key = (f, text, col)
+            img = text_cache.get(key)
+            if img is None:
+                if len(text_cache) >= TEXT_CACHE_MAX:
+                    text_cache.clear()
+                img = f.render(text, True, col).convert_alpha()
+                text_cache[key] = img
+            return img
+
+        def hud_clock_text(time_left: float) -> Tuple[str, str]:
+            """HUD 上會隨時間跳動的兩個數字（倒數、下次封鎖），主迴圈拿來判斷要不要重畫"""
+            next_in = max(0.0, PRESSURE_INTERVAL - (pressure_elapsed % PRESSURE_INTERVAL))
+            return f"{max(0.0, time_left):.1f}", f"{next_in:.0f}"
 
         def draw_top_ui(time_left: float):
             top = pygame.Rect(0, 0, W, TOP_UI_H)
@@ -275,65 +341,92 @@ class MinesweeperBuffGame:
             pygame.draw.line(screen, (60, 60, 70), (0, TOP_UI_H - 1), (W, TOP_UI_H - 1), 2)
 
             title = "小遊戲2：顧老爺的挑戰（踩地雷）"
-            screen.blit(font_mid.render(title, True, UI), (MARGIN, 16))
+            screen.blit(render_text(font_mid, title, UI), (MARGIN, 16))
 
+            time_txt, next_txt = hud_clock_text(time_left)
             status = (
                 f"命：{lives}/{LIVES_INIT}   炸彈剩餘：{len(bombs_current)}   "
-                f"已翻：{opened_safe_count()}/{total_safe_cells()}   倒數：{max(0.0, time_left):.1f}s"
+                f"已翻：{opened_safe_count()}/{total_safe_cells()}   倒數：{time_txt}s"
             )
-            screen.blit(font_small.render(status, True, UI2), (MARGIN, 52))
+            screen.blit(render_text(font_small, status, UI2), (MARGIN, 52))
 
             buff = f"Buff｜透視：{reveal_left}   爆破：{blast_left}   爆破模式：{'ON' if blast_mode else 'OFF'}（Space）"
-            screen.blit(font_small.render(buff, True, UI2), (MARGIN, 76))
+            screen.blit(render_text(font_small, buff, UI2), (MARGIN, 76))
 
             if started:
-                next_in = max(0.0, PRESSURE_INTERVAL - (pressure_elapsed % PRESSURE_INTERVAL))
                 lock_msg = "封鎖格：無" if locked_cell is None else f"封鎖格：({locked_cell[0]+1},{locked_cell[1]+1})"
-                msg = f"顧老爺壓力：{lock_msg}｜下次封鎖：{next_in:.0f}s"
-                screen.blit(font_small.render(msg, True, (210, 180, 255)), (W - MARGIN - 420, 52))
+                msg = f"顧老爺壓力：{lock_msg}｜下次封鎖：{next_txt}s"
+                screen.blit(render_text(font_small, msg, (210, 180, 255)), (W - MARGIN - 420, 52))
 
             if toast_t > 0 and toast_msg:
-                screen.blit(font_small.render(toast_msg, True, (245, 215, 120)), (W - MARGIN - 520, 76))
-
-        def draw_board():
-            pygame.draw.rect(screen, BORDER, board_rect, width=3, border_radius=10)
-
+                screen.blit(render_text(font_small, toast_msg, (245, 215, 120)), (W - MARGIN - 520, 76))
+
+        def tile_key(c: int, r: int) -> str:
+            if opened[r][c]:
+                if (c, r) in bombs_all and ((c, r) in bombs_triggered or (c, r) in bombs_defused):
+                    return "bomb"
+                return f"open_{max(0, numbers[r][c])}"
+            return "flag" if flagged[r][c] else "closed"
+
+        def draw_board(full: bool = True) -> List[pygame.Rect]:
+            """full=False 時只重畫外觀有變的格子；回傳這次畫過的範圍（給 display.update）"""
+            nonlocal flash_shown
+            # 紅閃遮罩蓋整個盤面：閃的期間和剛結束那幀都要整盤重畫
+            if flash_t > 0 or flash_shown:
+                full = True
+
+            if full:
+                screen.fill(BG, board_rect)
+                pygame.draw.rect(screen, BORDER, board_rect, width=3, border_radius=10)
+
+            changed: List[pygame.Rect] = []
+            batch: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+            bomb_cells: List[pygame.Rect] = []
             for r in range(ROWS):
                 for c in range(COLS):
-                    rect = rect_of(c, r).inflate(-2, -2)
-
-                    if opened[r][c]:
-                        pygame.draw.rect(screen, TILE_OPEN, rect, border_radius=6)
-
-                        pos = (c, r)
-                        if pos in bombs_all and (pos in bombs_triggered or pos in bombs_defused):
-                            draw_bomb_icon(rect)
-                        else:
-                            n = numbers[r][c]
-                            if n > 0:
-                                img = font_num.render(str(n), True, (30, 30, 36))
-                                screen.blit(img, img.get_rect(center=rect.center))
+                    key = tile_key(c, r)
+                    state = (key, locked_cell is not None and (c, r) == locked_cell)
+                    if not full and tile_state[r][c] == state:
+                        continue
+                    tile_state[r][c] = state
+
+                    if not full:
+                        # 圓角外露出的是底色 + 盤面外框，先補回來
+                        cell = rect_of(c, r)
+                        screen.fill(BG, cell)
+                        screen.set_clip(cell)
+                        pygame.draw.rect(screen, BORDER, board_rect, width=3, border_radius=10)
+                        screen.set_clip(None)
+                        changed.append(cell)
+
+                    pos = tile_pos[r][c]
+                    if key == "bomb":
+                        # 炸彈圖示的引信會畫到格子邊緣，少數幾格等 tile 貼完再直接畫
+                        batch.append((tile_cache["open_0"], pos))
+                        bomb_cells.append(pygame.Rect(pos, tile_box.size))
                     else:
-                        pygame.draw.rect(screen, TILE_CLOSED, rect, border_radius=6)
-                        if flagged[r][c]:
-                            pygame.draw.rect(screen, TILE_FLAG, rect.inflate(-12, -12), border_radius=6)
+                        batch.append((tile_cache[key], pos))
 
-                    if locked_cell is not None and (c, r) == locked_cell:
-                        overlay = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
-                        overlay.fill(LOCK_OVERLAY)
-                        screen.blit(overlay, rect.topleft)
-                        pygame.draw.rect(screen, LOCK_EDGE, rect, width=3, border_radius=6)
-                        draw_lock_icon(rect)
+                    if state[1]:
+                        batch.append((tile_cache["lock"], pos))
+
+            screen.blits(batch, doreturn=0)
+            for bomb_rect in bomb_cells:
+                draw_bomb_icon(bomb_rect)
 
             if flash_t > 0:
-                overlay = pygame.Surface((board_w, board_h), pygame.SRCALPHA)
-                overlay.fill((FLASH[0], FLASH[1], FLASH[2], 70))
-                screen.blit(overlay, (board_x, board_y))
+                screen.blit(flash_surf, (board_x, board_y))
+            flash_shown = flash_t > 0
+
+            return [board_rect] if full else changed
 
         def countdown(seconds: int = 3) -> bool:
             start = pygame.time.get_ticks()
             total_ms = seconds * 1000
-            big = pygame.font.SysFont("Microsoft JhengHei", 110, bold=True)
+            big = _font("Microsoft JhengHei", 110, bold=True)
+            # 3 / 2 / 1 / GO! 先畫好，迴圈裡只查表
+            glyphs = {str(n): big.render(str(n), True, UI).convert_alpha() for n in range(1, seconds + 1)}
+            glyphs["GO!"] = big.render("GO!", True, UI).convert_alpha()
 
             while True:
                 clock.tick(FPS)
@@ -355,7 +448,7 @@ class MinesweeperBuffGame:
                 draw_board()
 
                 txt = str(remain_s) if remain_s > 0 else "GO!"
-                img = big.render(txt, True, UI)
+                img = glyphs[txt]
                 screen.blit(img, img.get_rect(center=(W // 2, H // 2)))
                 pygame.display.flip()
 
@@ -365,7 +458,7 @@ class MinesweeperBuffGame:
         def button(surface, rect: pygame.Rect, text: str, hover: bool):
             pygame.draw.rect(surface, (240, 240, 245) if hover else (220, 220, 228), rect, border_radius=16)
             pygame.draw.rect(surface, (255, 255, 255), rect, width=2, border_radius=16)
-            t = font_mid.render(text, True, (25, 25, 30))
+            t = render_text(font_mid, text, (25, 25, 30))
             surface.blit(t, t.get_rect(center=rect.center))
 
         def result_screen(win: bool) -> Optional[str]:
@@ -410,14 +503,12 @@ class MinesweeperBuffGame:
                             if b1.collidepoint(mx, my):
                                 return "restart"
 
-                overlay = pygame.Surface((W, H), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 160))
-                screen.blit(overlay, (0, 0))
+                screen.blit(result_overlay, (0, 0))
 
-                t1 = font_big.render(title, True, UI)
+                t1 = render_text(font_big, title, UI)
                 screen.blit(t1, t1.get_rect(center=(W // 2, H // 2 - 70)))
 
-                t2 = font_small.render(sub, True, (220, 220, 220))
+                t2 = render_text(font_small, sub, (220, 220, 220))
                 screen.blit(t2, t2.get_rect(center=(W // 2, H // 2 - 25)))
 
                 if win:
@@ -428,7 +519,7 @@ class MinesweeperBuffGame:
                         button(screen, b2, "R：重來", hover2)
 
                     tip = "提示：Enter/Space 也可直接進入第四章"
-                    tip_img = font_small.render(tip, True, (210, 210, 220))
+                    tip_img = render_text(font_small, tip, (210, 210, 220))
                     screen.blit(tip_img, tip_img.get_rect(center=(W // 2, H // 2 + 190)))
                 else:
                     hover1 = b1.collidepoint(mx, my)
@@ -468,11 +559,20 @@ class MinesweeperBuffGame:
         toast_msg = ""
         toast_t = 0.0
         flash_t = 0.0
+        flash_shown = False
 
         locked_cell: Optional[Tuple[int, int]] = None
         pressure_elapsed = 0.0
         next_pressure_at = PRESSURE_INTERVAL
 
+        # 上一次畫到螢幕上的每格外觀；None = 還沒畫過
+        tile_state: List[List[Optional[Tuple[str, bool]]]] = [[None] * COLS for _ in range(ROWS)]
+        top_rect = pygame.Rect(0, 0, W, TOP_UI_H)
+        full_redraw = True
+        # 沒有輸入、倒數字串沒變、也沒有 toast/紅閃在跑時，整幀不用畫
+        needs_redraw = True
+        shown_clock: Tuple[str, str] = ("", "")
+
         def pick_locked_cell():
             """
             ✅ 防死局版本：
@@ -519,6 +619,7 @@ class MinesweeperBuffGame:
             nonlocal lives, time_left, started, blast_mode, reveal_left, blast_left
             nonlocal toast_msg, toast_t, flash_t
             nonlocal locked_cell, pressure_elapsed, next_pressure_at
+            nonlocal full_redraw
 
             opened = [[False] * COLS for _ in range(ROWS)]
             flagged = [[False] * COLS for _ in range(ROWS)]
@@ -548,6 +649,8 @@ class MinesweeperBuffGame:
             pressure_elapsed = 0.0
             next_pressure_at = PRESSURE_INTERVAL
 
+            full_redraw = True
+
         reset_all()
 
         if not countdown(3):
@@ -559,8 +662,11 @@ class MinesweeperBuffGame:
 
             if toast_t > 0:
                 toast_t = max(0.0, toast_t - dt)
-            if flash_t > 0:
+                if toast_t == 0:
+                    needs_redraw = True
+            if flash_t > 0 or flash_shown:
                 flash_t = max(0.0, flash_t - dt)
+                needs_redraw = True
 
             if started:
                 time_left -= dt
@@ -578,14 +684,28 @@ class MinesweeperBuffGame:
                     next_pressure_at += PRESSURE_INTERVAL
                     new_lock = pick_locked_cell()
                     locked_cell = new_lock
+                    needs_redraw = True
                     if locked_cell is not None:
                         toast(f"顧老爺施壓！封鎖了一格：({locked_cell[0]+1},{locked_cell[1]+1})", TOAST_IMPORTANT)
 
+                # 倒數 / 下次封鎖 的顯示字串有變才需要重畫
+                hud_clock = hud_clock_text(time_left)
+                if hud_clock != shown_clock:
+                    shown_clock = hud_clock
+                    needs_redraw = True
+
             for e in pygame.event.get():
                 if e.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit(0)
 
+                if e.type == pygame.WINDOWEXPOSED:
+                    # 視窗被蓋住 / 縮小後再露出來，部分更新補不回來，整個重畫
+                    full_redraw = True
+
+                if e.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+                    needs_redraw = True
+
                 if e.type == pygame.KEYDOWN:
                     if e.key == pygame.K_ESCAPE:
                         return False
@@ -668,7 +788,20 @@ class MinesweeperBuffGame:
                     return True
                 return False
 
-            screen.fill(BG)
-            draw_top_ui(time_left)
-            draw_board()
-            pygame.display.flip()
+            if full_redraw:
+                screen.fill(BG)
+                draw_top_ui(time_left)
+                draw_board(full=True)
+                pygame.display.flip()
+                full_redraw = False
+                needs_redraw = False
+            elif needs_redraw:
+                needs_redraw = False
+                # 上方資訊列每幀都可能變（倒數）；盤面只送出有變的格子
+                # 分隔線會畫到 y=TOP_UI_H 那排（盤面上框），部分更新時限制在 top_rect 內
+                screen.set_clip(top_rect)
+                draw_top_ui(time_left)
+                screen.set_clip(None)
+                dirty = [top_rect]
+                dirty += draw_board(full=False)
+                pygame.display.update(dirty)
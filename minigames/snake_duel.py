@@ -1,7 +1,7 @@
 # minigames/snake_duel.py
 import sys
 import random
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 import pygame
 
@@ -67,6 +67,30 @@ class SnakeDuelGame:
         cols = board_w // GRID
         rows = board_h // GRID
 
+        # 字型只建一次；固定字串先 render 好
+        font_big = pygame.font.SysFont("Microsoft JhengHei", 110, bold=True)
+        font_result = pygame.font.SysFont("Microsoft JhengHei", 52, bold=True)
+        font_btn = pygame.font.SysFont("Microsoft JhengHei", 28, bold=True)
+        you_img = pygame.font.SysFont("Microsoft JhengHei", 18, bold=True).render("YOU", True, (20, 20, 20))
+        you_bg = pygame.Surface((you_img.get_width() + 10, you_img.get_height() + 6), pygame.SRCALPHA)
+        you_bg.fill((255, 255, 255, 210))
+        you_bg.blit(you_img, (5, 3))
+        you_bg = you_bg.convert_alpha()
+
+        TEXT_CACHE_MAX = 64
+        text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+
+        def render_text(f: pygame.font.Font, text: str, col) -> pygame.Surface:
+            # 標題 / 計分 / 倒數字串很少變，同一串只 render 一次；會變的字串（提示 / 分數）累積滿了就整包清掉
+            key = (f, text, col)
+            img = text_cache.get(key)
+            if img is None:
+                if len(text_cache) >= TEXT_CACHE_MAX:
+                    text_cache.clear()
+                img = f.render(text, True, col).convert_alpha()
+                text_cache[key] = img
+            return img
+
         # ---------------- helpers ----------------
         def cell_to_px(c: Vec) -> pygame.Rect:
             x = board_x + c[0] * GRID
@@ -95,10 +119,8 @@ class SnakeDuelGame:
             pygame.draw.rect(screen, PANEL, top_rect)
             pygame.draw.line(screen, (60, 60, 70), (0, BOARD_TOP - 1), (W, BOARD_TOP - 1), 2)
 
-            t1 = font.render(text_top, True, UI)
-            screen.blit(t1, (BOARD_MARGIN, 18))
-            t2 = font.render(text_sub, True, (200, 200, 210))
-            screen.blit(t2, (BOARD_MARGIN, 52))
+            screen.blit(render_text(font, text_top, UI), (BOARD_MARGIN, 18))
+            screen.blit(render_text(font, text_sub, (200, 200, 210)), (BOARD_MARGIN, 52))
 
         def draw_crown_marker(head_rect: pygame.Rect):
             # 皇冠小三角（很醒目）
@@ -115,23 +137,29 @@ class SnakeDuelGame:
             pygame.draw.polygon(screen, PLAYER_ACCENT, pts)
 
         def draw_you_label(head_rect: pygame.Rect):
-            small = pygame.font.SysFont("Microsoft JhengHei", 18, bold=True)
-            img = small.render("YOU", True, (20, 20, 20))
-            bg = pygame.Surface((img.get_width() + 10, img.get_height() + 6), pygame.SRCALPHA)
-            bg.fill((255, 255, 255, 210))
-            screen.blit(bg, (head_rect.centerx - bg.get_width() // 2, head_rect.top - 36))
-            screen.blit(img, (head_rect.centerx - img.get_width() // 2, head_rect.top - 33))
+            screen.blit(you_bg, (head_rect.centerx - you_bg.get_width() // 2, head_rect.top - 36))
+
+        # 蛇身 / 蛇頭的圓角方塊先畫好，每幀只 blit
+        def make_tile(rect: pygame.Rect, col, radius: int) -> pygame.Surface:
+            surf = pygame.Surface(rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, col, surf.get_rect(), border_radius=radius)
+            return surf.convert_alpha()
+
+        body_box = pygame.Rect(0, 0, GRID, GRID).inflate(-3, -3)
+        head_box = pygame.Rect(0, 0, GRID, GRID).inflate(-1, -1)
+        body_tiles = {col: make_tile(body_box, col, 6) for col in (PLAYER_BODY, ENEMY1_BODY, ENEMY2_BODY)}
+        head_tiles = {col: make_tile(head_box, col, 8) for col in (PLAYER_HEAD, ENEMY1_HEAD, ENEMY2_HEAD)}
 
         def draw_snake(snake: List[Vec], body_col, head_col, is_player=False):
-            # body
-            for c in reversed(snake):
-                r = cell_to_px(c).inflate(-3, -3)
-                pygame.draw.rect(screen, body_col, r, border_radius=6)
+            # body（一次 blits）
+            tile = body_tiles[body_col]
+            ox, oy = board_x + body_box.x, board_y + body_box.y
+            screen.blits([(tile, (ox + c[0] * GRID, oy + c[1] * GRID)) for c in reversed(snake)], doreturn=0)
 
             # head
             head = snake[0]
             hr = cell_to_px(head).inflate(-1, -1)
-            pygame.draw.rect(screen, head_col, hr, border_radius=8)
+            screen.blit(head_tiles[head_col], hr.topleft)
 
             # eyes direction
             if len(snake) >= 2:
@@ -189,6 +217,10 @@ class SnakeDuelGame:
         invincible_timer = 0.0  # ✅ 開場緩衝
         enter_cooldown = 0.0    # ✅ 避免 Enter 被吃事件
 
+        def occupied(c: Vec) -> bool:
+            # 單點查詢直接掃 list（C 迴圈），不用每步重建 set
+            return c in player or c in enemy1 or c in enemy2
+
         def all_occupied() -> set:
             occ = set(player)
             occ |= set(enemy1)
@@ -275,7 +307,7 @@ class SnakeDuelGame:
         def countdown(seconds: int = 3) -> bool:
             start = pygame.time.get_ticks()
             total_ms = seconds * 1000
-            big = pygame.font.SysFont("Microsoft JhengHei", 110, bold=True)
+            big = font_big
 
             while True:
                 clock.tick(FPS)
@@ -300,7 +332,7 @@ class SnakeDuelGame:
                 )
 
                 txt = str(remain_s) if remain_s > 0 else "GO!"
-                num = big.render(txt, True, UI)
+                num = render_text(big, txt, UI)
                 screen.blit(num, num.get_rect(center=(W // 2, H // 2)))
                 pygame.display.flip()
 
@@ -310,8 +342,8 @@ class SnakeDuelGame:
         # ✅【改】這裡改成回傳字串： "restart" / "exit" / "next"
         def result_screen(win: bool) -> Optional[str]:
             nonlocal enter_cooldown
-            big = pygame.font.SysFont("Microsoft JhengHei", 52, bold=True)
-            mid = pygame.font.SysFont("Microsoft JhengHei", 28, bold=True)
+            big = font_result
+            mid = font_btn
 
             title = "勝利！你搶先吃到 15 顆果實！" if win else "失敗！你被撞到了！"
             sub = "Enter 重來｜ESC 離開" if not win else "Enter 重來｜ESC 離開｜或點按鈕進入第三章"
@@ -348,8 +380,8 @@ class SnakeDuelGame:
                 overlay.fill((0, 0, 0, 140))
                 screen.blit(overlay, (0, 0))
 
-                t1 = big.render(title, True, UI)
-                t2 = font.render(sub, True, (220, 220, 220))
+                t1 = render_text(big, title, UI)
+                t2 = render_text(font, sub, (220, 220, 220))
                 screen.blit(t1, t1.get_rect(center=(W // 2, H // 2 - 50)))
                 screen.blit(t2, t2.get_rect(center=(W // 2, H // 2 + 8)))
 
@@ -357,7 +389,7 @@ class SnakeDuelGame:
                 if win:
                     pygame.draw.rect(screen, (240, 240, 240), btn_next, border_radius=14)
                     pygame.draw.rect(screen, (255, 255, 255), btn_next, width=2, border_radius=14)
-                    btxt = mid.render("進入第三章", True, (20, 20, 20))
+                    btxt = render_text(mid, "進入第三章", (20, 20, 20))
                     screen.blit(btxt, btxt.get_rect(center=btn_next.center))
 
                 pygame.display.flip()
@@ -412,7 +444,7 @@ class SnakeDuelGame:
                         # 無敵期：撞牆就不動
                         nh = player[0]
 
-                if invincible_timer <= 0 and (nh in set(player) or nh in set(enemy1) or nh in set(enemy2)):
+                if invincible_timer <= 0 and occupied(nh):
                     # ✅【改】依 result_screen 回傳處理
                     action = result_screen(False)
                     if action == "restart":
@@ -447,7 +479,7 @@ class SnakeDuelGame:
 
                 dir_enemy1 = ai_next_dir(enemy1[0], dir_enemy1)
                 nh1 = (enemy1[0][0] + dir_enemy1[0], enemy1[0][1] + dir_enemy1[1])
-                if inside(nh1) and nh1 not in all_occupied():
+                if inside(nh1) and not occupied(nh1):
                     enemy1 = move_snake(enemy1, dir_enemy1, nh1 == fruit)
                     if nh1 == fruit:
                         fruit = spawn_fruit()
@@ -455,7 +487,7 @@ class SnakeDuelGame:
                 dir_enemy2 = ai_next_dir(enemy2[0], dir_enemy2)
                 nh2 = (enemy2[0][0] + dir_enemy2[0], dir_enemy2[1] + enemy2[0][1])
                 nh2 = (enemy2[0][0] + dir_enemy2[0], enemy2[0][1] + dir_enemy2[1])
-                if inside(nh2) and nh2 not in all_occupied():
+                if inside(nh2) and not occupied(nh2):
                     enemy2 = move_snake(enemy2, dir_enemy2, nh2 == fruit)
                     if nh2 == fruit:
                         fruit = spawn_fruit()
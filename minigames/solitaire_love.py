@@ -1,6 +1,7 @@
 # minigames/solitaire_love.py
 import sys
 import random
+import bisect
 from dataclasses import dataclass
 from typing import List, Optional, Tuple, Dict
 
@@ -95,6 +96,20 @@ class SolitaireLoveGame:
         rank_font = pygame.font.SysFont("Microsoft JhengHei", max(16, int(26 * SCALE)), bold=True)
         suit_font = pygame.font.SysFont("Segoe UI Symbol", max(16, int(26 * SCALE)), bold=True)
 
+        TEXT_CACHE_MAX = 64
+        text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+
+        def render_text(f: pygame.font.Font, text: str, col) -> pygame.Surface:
+            # 牌面 / 面板 / 按鈕字串每幀都一樣，同一串只 render 一次；會變的字串（提示 / 分數）累積滿了就整包清掉
+            key = (f, text, col)
+            img = text_cache.get(key)
+            if img is None:
+                if len(text_cache) >= TEXT_CACHE_MAX:
+                    text_cache.clear()
+                img = f.render(text, True, col).convert_alpha()
+                text_cache[key] = img
+            return img
+
         # -------------------------
         # Layout
         # -------------------------
@@ -169,17 +184,17 @@ class SolitaireLoveGame:
 
             # ✅ 標題也移除倒數字樣
             title = "第三關：追回林溪然（接龍）｜完成基礎牌堆（Foundation）｜ESC 離開"
-            screen.blit(font_title.render(title, True, UI), (MARGIN, 14))
+            screen.blit(render_text(font_title, title, UI), (MARGIN, 14))
 
             info = f"Stock：{len(stock)}｜Waste：{len(waste)}"
-            screen.blit(font_small.render(info, True, UI2), (MARGIN, 52))
+            screen.blit(render_text(font_small, info, UI2), (MARGIN, 52))
 
             heart_str = "♥" * hearts + "□" * (4 - hearts)
             prog = f"好感度：{heart_str}  ({hearts * 25}%)"
-            screen.blit(font_small.render(prog, True, (255, 180, 200)), (W - MARGIN - 260, 52))
+            screen.blit(render_text(font_small, prog, (255, 180, 200)), (W - MARGIN - 260, 52))
 
             if toast_timer > 0 and toast_msg:
-                screen.blit(font_small.render(toast_msg, True, (245, 215, 120)), (W - MARGIN - 520, 18))
+                screen.blit(render_text(font_small, toast_msg, (245, 215, 120)), (W - MARGIN - 520, 18))
 
         def draw_card(rect: pygame.Rect, card: Optional[Card], face_up: bool, selected: bool = False):
             if card is None:
@@ -199,12 +214,12 @@ class SolitaireLoveGame:
                     suit = SUIT_CHAR[card.suit]
                     col = RED if card.color_red else BLACK
 
-                img_rank = rank_font.render(txt, True, col)
-                img_suit = suit_font.render(suit, True, col)
+                img_rank = render_text(rank_font, txt, col)
+                img_suit = render_text(suit_font, suit, col)
                 screen.blit(img_rank, (rect.x + 6, rect.y + 6))
                 screen.blit(img_suit, (rect.x + 6, rect.y + 24))
 
-                center_suit = suit_font.render(suit, True, col)
+                center_suit = img_suit
                 screen.blit(center_suit, center_suit.get_rect(center=rect.center))
             else:
                 pygame.draw.rect(screen, CARD_BACK, rect, border_radius=12)
@@ -243,19 +258,32 @@ class SolitaireLoveGame:
                 y += TABLEAU_FACEUP_Y if tableau[col][k].face_up else TABLEAU_FACEDOWN_Y
             return pygame.Rect(tableau_rects[col].x, y, CARD_W, CARD_H)
 
+        def tableau_card_ys(col: int) -> List[int]:
+            # 一次累加出整欄每張牌的 y，不用每張都從頭加
+            ys = []
+            y = tableau_rects[col].y
+            for card in tableau[col]:
+                ys.append(y)
+                y += TABLEAU_FACEUP_Y if card.face_up else TABLEAU_FACEDOWN_Y
+            return ys
+
         def hit_test_tableau(pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
             x, y = pos
-            for col in range(7):
-                if not tableau_rects[col].collidepoint(x, y):
-                    continue
-                if not tableau[col]:
-                    return (col, -1)
-                for idx in range(len(tableau[col]) - 1, -1, -1):
-                    r = get_tableau_card_rect(col, idx)
-                    if r.collidepoint(x, y):
-                        return (col, idx)
-                return (col, len(tableau[col]) - 1)
-            return None
+            # 欄位等寬等距：直接算出第幾欄
+            dx = x - tableau_x0
+            if dx < 0:
+                return None
+            col, off = divmod(dx, CARD_W + GAP_X)
+            if col >= 7 or off >= CARD_W or not tableau_rects[col].collidepoint(x, y):
+                return None
+            if not tableau[col]:
+                return (col, -1)
+            # y 單調遞增：最上面那張含 y 的牌 = 最後一個 top <= y 的牌
+            ys = tableau_card_ys(col)
+            idx = bisect.bisect_right(ys, y) - 1
+            if idx >= 0 and y < ys[idx] + CARD_H:
+                return (col, idx)
+            return (col, len(tableau[col]) - 1)
 
         def draw_piles():
             for i, suit in enumerate(SUITS):
@@ -263,7 +291,7 @@ class SolitaireLoveGame:
                 top = top_foundation_card(suit)
                 if top is None:
                     pygame.draw.rect(screen, (55, 60, 72), rect, width=2, border_radius=12)
-                    s_img = suit_font.render(SUIT_CHAR[suit], True, (170, 170, 185))
+                    s_img = render_text(suit_font, SUIT_CHAR[suit], (170, 170, 185))
                     screen.blit(s_img, s_img.get_rect(center=rect.center))
                 else:
                     draw_card(rect, top, True)
@@ -282,8 +310,9 @@ class SolitaireLoveGame:
                 base = pygame.Rect(tableau_rects[col].x, tableau_rects[col].y, CARD_W, CARD_H)
                 pygame.draw.rect(screen, (40, 45, 55), base, width=2, border_radius=12)
 
-                for idx, card in enumerate(tableau[col]):
-                    r = get_tableau_card_rect(col, idx)
+                x = tableau_rects[col].x
+                for idx, (card, y) in enumerate(zip(tableau[col], tableau_card_ys(col))):
+                    r = pygame.Rect(x, y, CARD_W, CARD_H)
                     sel = (selected_from == ("tableau", col) and selected_index == idx)
                     draw_card(r, card, card.face_up, selected=sel)
 
@@ -297,7 +326,7 @@ class SolitaireLoveGame:
                     bg = (160, 160, 170)
                 pygame.draw.rect(screen, bg, rect, border_radius=14)
                 pygame.draw.rect(screen, (255, 255, 255), rect, width=2, border_radius=14)
-                t = font_mid.render(text, True, BTN_TXT)
+                t = render_text(font_mid, text, BTN_TXT)
                 screen.blit(t, t.get_rect(center=rect.center))
 
             btn(btn_reveal, f"回憶 Reveal x{reveal_left}", reveal_left > 0)
@@ -487,7 +516,8 @@ class SolitaireLoveGame:
             return ok
 
         def check_win() -> bool:
-            return all(len(foundation[s]) == 13 for s in SUITS)
+            # 完成一個花色 hearts 就 +1（基礎牌堆只進不出），滿 4 就是全部完成
+            return hearts == 4
 
         def draw_hint():
             if hint_timer > 0 and hint_src_rect:
@@ -495,7 +525,7 @@ class SolitaireLoveGame:
             if hint_timer > 0 and hint_dst_rect:
                 pygame.draw.rect(screen, HINT_DST, hint_dst_rect.inflate(6, 6), width=4, border_radius=14)
             if hint_timer > 0 and hint_msg:
-                img = font_small.render(hint_msg, True, (245, 215, 120))
+                img = render_text(font_small, hint_msg, (245, 215, 120))
                 screen.blit(img, (MARGIN, H - MARGIN - 24))
 
         def result_overlay() -> Optional[bool]:
@@ -537,10 +567,10 @@ class SolitaireLoveGame:
                 overlay.fill((0, 0, 0, 165))
                 screen.blit(overlay, (0, 0))
 
-                t1 = big.render(title, True, UI)
+                t1 = render_text(big, title, UI)
                 screen.blit(t1, t1.get_rect(center=(W // 2, H // 2 - 80)))
 
-                t2 = small.render(sub, True, (220, 220, 220))
+                t2 = render_text(small, sub, (220, 220, 220))
                 screen.blit(t2, t2.get_rect(center=(W // 2, H // 2 - 30)))
 
                 def draw_btn(rect: pygame.Rect, text: str):
@@ -548,7 +578,7 @@ class SolitaireLoveGame:
                     bg = (245, 245, 250) if hover else (230, 230, 238)
                     pygame.draw.rect(screen, bg, rect, border_radius=18)
                     pygame.draw.rect(screen, (255, 255, 255), rect, width=2, border_radius=18)
-                    img = mid.render(text, True, (25, 25, 30))
+                    img = render_text(mid, text, (25, 25, 30))
                     screen.blit(img, img.get_rect(center=rect.center))
 
                 draw_btn(btn_proceed, "進入第五章（Enter/Space）")